@@ -57,14 +57,23 @@ def run(step, profile):
     required=False,
     help="The name of the recipe step for which to remove cached outputs.",
 )
+@click.option(
+    "--include-downstream",
+    is_flag=True,
+    default=False,
+    help=(
+        "If specified along with --step, also remove the cached outputs of the steps that follow"
+        " the specified step in the recipe."
+    ),
+)
 @_CLI_ARG_RECIPE_PROFILE
-def clean(step, profile):
+def clean(step, include_downstream, profile):
     """
     Remove all recipe outputs from the cache, or remove the cached outputs of a particular
     recipe step if specified. After cached outputs are cleaned for a particular step, the step
     will be re-executed in its entirety the next time it is run.
     """
-    Recipe(profile=profile).clean(step)
+    Recipe(profile=profile).clean(step, include_downstream=include_downstream)
 
 
 @commands.command(
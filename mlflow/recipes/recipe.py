@@ -131,7 +131,7 @@ class BaseRecipe:
             output_directory = get_step_output_path(self._recipe_root_path, step, "")
             self._get_step(step).inspect(output_directory)
 
-    def clean(self, step: Optional[str] = None) -> None:
+    def clean(self, step: Optional[str] = None, include_downstream: bool = False) -> None:
         """
         Removes the outputs of the specified step from the cache, or removes the cached outputs
         of all steps if no particular step is specified. After cached outputs are cleaned
@@ -141,8 +141,19 @@ class BaseRecipe:
         Args:
             step: String name of the step to clean within the recipe. If not specified,
                 cached outputs are removed for all recipe steps.
+            include_downstream: If ``True``, also removes the cached outputs of the steps that
+                follow the specified step in its subgraph. Has no effect if ``step`` is not
+                specified.
         """
-        to_clean = self._steps if not step else [self._get_step(step)]
+        if not step:
+            to_clean = self._steps
+        else:
+            target_step = self._get_step(step)
+            to_clean = [target_step]
+            if include_downstream:
+                subgraph = self._get_subgraph_for_target_step(target_step)
+                if target_step in subgraph:
+                    to_clean = subgraph[subgraph.index(target_step) :]
         clean_execution_state(self._recipe_root_path, to_clean)
 
     def _get_step(self, step_name) -> BaseStep:
@@ -341,7 +341,7 @@ class RegressionRecipe(BaseRecipe):
 
         return super().get_artifact(artifact_name=artifact_name)
 
-    def clean(self, step: Optional[str] = None) -> None:
+    def clean(self, step: Optional[str] = None, include_downstream: bool = False) -> None:
         """
         Removes all recipe outputs from the cache, or removes the cached outputs of a particular
         recipe step if specified. After cached outputs are cleaned for a particular step, the
@@ -350,6 +350,9 @@ class RegressionRecipe(BaseRecipe):
         Args:
             step: String name of the step to clean within the recipe. If not specified,
                 cached outputs are removed for all recipe steps.
+            include_downstream: If ``True``, also removes the cached outputs of the steps that
+                follow the specified step in the recipe. Has no effect if ``step`` is not
+                specified.
 
         .. code-block:: python
 
@@ -371,7 +374,7 @@ class RegressionRecipe(BaseRecipe):
             # are still cached
             regression_recipe.run(step="train")
         """
-        super().clean(step=step)
+        super().clean(step=step, include_downstream=include_downstream)
 
     def inspect(self, step: Optional[str] = None) -> None:
         """
@@ -7,13 +7,15 @@ import traceback
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-import yaml
-
 from mlflow.recipes.cards import CARD_HTML_NAME, CARD_PICKLE_NAME, BaseCard, FailureCard
 from mlflow.recipes.utils import get_recipe_name
 from mlflow.recipes.utils.step import display_html
 from mlflow.tracking import MlflowClient
-from mlflow.utils.databricks_utils import is_in_databricks_runtime
+from mlflow.utils.databricks_utils import (
+    is_in_databricks_runtime,
+    is_running_in_ipython_environment,
+)
+from mlflow.utils.file_utils import read_yaml
 
 _logger = logging.getLogger(__name__)
 
@@ -163,9 +165,14 @@ class BaseStep(metaclass=abc.ABCMeta):
             )
             return None
 
-        card = BaseCard.load(card_path)
         card_html_path = os.path.join(output_directory, CARD_HTML_NAME)
-        display_html(html_data=card.to_html(), html_file_path=card_html_path)
+        if is_running_in_ipython_environment():
+            card = BaseCard.load(card_path)
+            display_html(html_data=card.to_html(), html_file_path=card_html_path)
+        else:
+            # Outside of IPython, the card is displayed by opening the HTML file that was written
+            # when the step ran, so there is no need to deserialize and re-render the card
+            display_html(html_file_path=card_html_path)
 
     @abc.abstractmethod
     def _run(self, output_directory: str) -> BaseCard:
@@ -221,8 +228,9 @@ class BaseStep(metaclass=abc.ABCMeta):
         Returns:
             class instance of the step.
         """
-        with open(step_config_path) as f:
-            step_config = yaml.safe_load(f)
+        step_config = read_yaml(
+            root=os.path.dirname(step_config_path), file_name=os.path.basename(step_config_path)
+        )
         return cls(step_config, recipe_root)
 
     @property
@@ -380,7 +388,13 @@ class BaseStep(metaclass=abc.ABCMeta):
 
         predictions = np.array(predictions)
         abs_error = np.absolute(error)
-        worst_k_indexes = np.argsort(abs_error)[::-1][:worst_k]
+        # Select the k largest errors in linear time and only sort those, rather than sorting the
+        # errors of the whole dataset
+        if 0 < worst_k < len(abs_error):
+            worst_k_indexes = np.argpartition(abs_error, -worst_k)[-worst_k:]
+        else:
+            worst_k_indexes = np.arange(len(abs_error))
+        worst_k_indexes = worst_k_indexes[np.argsort(abs_error[worst_k_indexes])[::-1]][:worst_k]
         result_df = dataframe.iloc[worst_k_indexes].assign(
             prediction=predictions[worst_k_indexes],
             absolute_error=abs_error[worst_k_indexes],
@@ -11,7 +11,7 @@ import cloudpickle
 import yaml
 
 import mlflow
-from mlflow.entities import SourceType, ViewType
+from mlflow.entities import Metric, Param, RunTag, SourceType, ViewType
 from mlflow.environment_variables import MLFLOW_RECIPES_EXECUTION_TARGET_STEP_NAME
 from mlflow.exceptions import BAD_REQUEST, INVALID_PARAMETER_VALUE, MlflowException
 from mlflow.models import Model
@@ -50,7 +50,7 @@ from mlflow.recipes.utils.wrapped_recipe_model import WrappedRecipeModel
 from mlflow.tracking import MlflowClient
 from mlflow.tracking.fluent import _get_experiment_id
 from mlflow.utils.databricks_utils import get_databricks_env_vars, get_databricks_run_url
-from mlflow.utils.file_utils import TempDir
+from mlflow.utils.file_utils import TempDir, YamlSafeDumper
 from mlflow.utils.mlflow_tags import (
     MLFLOW_RECIPE_PROFILE_NAME,
     MLFLOW_RECIPE_STEP_NAME,
@@ -58,6 +58,7 @@ from mlflow.utils.mlflow_tags import (
     MLFLOW_SOURCE_TYPE,
 )
 from mlflow.utils.string_utils import strip_prefix
+from mlflow.utils.time import get_current_time_millis
 
 _REBALANCING_CUTOFF = 5000
 _REBALANCING_DEFAULT_RATIO = 0.3
@@ -1251,20 +1252,35 @@ class TrainStep(BaseStep):
     def _log_estimator_to_mlflow(self, estimator, X_train_sampled, on_worker=False):
         from mlflow.models import infer_signature
 
+        # Accumulate estimator metrics, params and tags and log them in a single batch request,
+        # rather than issuing a separate tracking request for each of them
+        metrics = []
+        params = {}
+        tags = {}
         if hasattr(estimator, "best_score_") and (type(estimator.best_score_) in [int, float]):
-            mlflow.log_metric("best_cv_score", estimator.best_score_)
+            metrics.append(
+                Metric("best_cv_score", estimator.best_score_, get_current_time_millis(), 0)
+            )
         if hasattr(estimator, "best_params_"):
-            mlflow.log_params(estimator.best_params_)
+            params.update(estimator.best_params_)
 
         if on_worker:
-            mlflow.log_params(estimator.get_params())
-            estimator_tags = {
-                "estimator_name": estimator.__class__.__name__,
-                "estimator_class": (
-                    estimator.__class__.__module__ + "." + estimator.__class__.__name__
-                ),
-            }
-            mlflow.set_tags(estimator_tags)
+            params.update(estimator.get_params())
+            tags.update(
+                {
+                    "estimator_name": estimator.__class__.__name__,
+                    "estimator_class": (
+                        estimator.__class__.__module__ + "." + estimator.__class__.__name__
+                    ),
+                }
+            )
+        if metrics or params or tags:
+            MlflowClient().log_batch(
+                run_id=mlflow.active_run().info.run_id,
+                metrics=metrics,
+                params=[Param(key, str(value)) for key, value in params.items()],
+                tags=[RunTag(key, str(value)) for key, value in tags.items()],
+            )
         estimator_schema = infer_signature(
             X_train_sampled, estimator.predict(X_train_sampled.copy())
         )
@@ -1317,7 +1333,7 @@ class TrainStep(BaseStep):
                 processed_data[key] = str(value)
 
         if len(processed_data) > 0:
-            yaml.safe_dump(processed_data, file, **kwargs)
+            yaml.dump(processed_data, file, Dumper=YamlSafeDumper, **kwargs)
 
     def _rebalance_classes(self, train_df):
         import pandas as pd
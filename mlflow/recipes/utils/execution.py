@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import logging
 import os
@@ -11,6 +12,7 @@ from mlflow.environment_variables import (
     MLFLOW_RECIPES_EXECUTION_TARGET_STEP_NAME,
 )
 from mlflow.recipes.step import BaseStep, StepStatus
+from mlflow.recipes.utils.tracking import cache_run_tags_env_vars
 from mlflow.utils.file_utils import read_yaml, write_yaml
 from mlflow.utils.process import _exec_cmd
 
@@ -19,6 +21,18 @@ _logger = logging.getLogger(__name__)
 _STEPS_SUBDIRECTORY_NAME = "steps"
 _STEP_OUTPUTS_SUBDIRECTORY_NAME = "outputs"
 _STEP_CONF_YAML_NAME = "conf.yaml"
+_STEP_FILE_HASHES_SUBDIRECTORY_NAME = "step_file_hashes"
+_STEP_FILE_HASH_SUFFIX = ".sha256"
+# User-defined step files that must exist in the `steps` folder of a recipe. Make rules depend on
+# content hashes of these files rather than the files themselves
+# (see `_write_updated_step_file_hashes`)
+_REQUIRED_STEP_FILE_NAMES = [
+    "ingest.py",
+    "split.py",
+    "train.py",
+    "transform.py",
+    "custom_metrics.py",
+]
 
 
 def run_recipe_step(
@@ -74,6 +88,10 @@ def run_recipe_step(
         recipe_steps=recipe_steps,
         execution_directory_path=execution_dir_path,
     )
+    _write_updated_step_file_hashes(
+        recipe_root_path=recipe_root_path,
+        execution_directory_path=execution_dir_path,
+    )
 
     # Aggregate step-specific environment variables into a single environment dictionary
     # that is passed to the Make subprocess. In the future, steps with different environments
@@ -82,8 +100,10 @@ def run_recipe_step(
         # Include target step name in the environment variable set
         MLFLOW_RECIPES_EXECUTION_TARGET_STEP_NAME.name: target_step.name,
     }
-    for step in recipe_steps:
-        make_env.update(step.environment)
+    # Run tags are part of the environment of several steps. Resolve them once per execution
+    with cache_run_tags_env_vars():
+        for step in recipe_steps:
+            make_env.update(step.environment)
     # Use Make to run the target step and all of its dependencies
     _run_make(
         execution_directory_path=execution_dir_path,
@@ -225,6 +245,39 @@ def _write_updated_step_confs(recipe_steps: List[BaseStep], execution_directory_
             )
 
 
+def _write_updated_step_file_hashes(recipe_root_path: str, execution_directory_path: str) -> None:
+    """
+    Computes content hashes of the user-defined step files (e.g. `steps/train.py`) of the
+    specified recipe and compares them with the hashes written by prior executions. A hash file
+    is only rewritten when the content of the corresponding step file changes. Make rules depend
+    on these hash files instead of the step files, so touching a step file or switching branches
+    without changing its content does not invalidate cached step outputs.
+
+    Args:
+        recipe_root_path: The absolute path of the recipe root directory on the local
+            filesystem.
+        execution_directory_path: The absolute path of the execution directory on the local
+            filesystem for the specified recipe. Hash files are written to a subdirectory of
+            this execution directory.
+    """
+    hashes_dir_path = os.path.join(execution_directory_path, _STEP_FILE_HASHES_SUBDIRECTORY_NAME)
+    os.makedirs(hashes_dir_path, exist_ok=True)
+    for step_file_name in _REQUIRED_STEP_FILE_NAMES:
+        with open(os.path.join(recipe_root_path, "steps", step_file_name), "rb") as f:
+            step_file_hash = hashlib.sha256(f.read()).hexdigest()
+
+        hash_file_path = os.path.join(hashes_dir_path, step_file_name + _STEP_FILE_HASH_SUFFIX)
+        if os.path.exists(hash_file_path):
+            with open(hash_file_path) as f:
+                prev_step_file_hash = f.read()
+        else:
+            prev_step_file_hash = None
+
+        if prev_step_file_hash != step_file_hash:
+            with open(hash_file_path, "w") as f:
+                f.write(step_file_hash)
+
+
 def get_or_create_base_execution_directory(recipe_root_path: str) -> str:
     """
     Obtains the path of the execution directory on the local filesystem corresponding to the
@@ -261,7 +314,14 @@ def _get_execution_directory_basename(recipe_root_path):
     Returns:
         The basename of the execution directory corresponding to the specified recipe.
     """
-    return hashlib.sha256(os.path.abspath(recipe_root_path).encode("utf-8")).hexdigest()
+    # Resolve the path before hitting the cache, since relative paths depend on the current
+    # working directory
+    return _hash_recipe_root_path(os.path.abspath(recipe_root_path))
+
+
+@functools.lru_cache(maxsize=64)
+def _hash_recipe_root_path(abs_recipe_root_path: str) -> str:
+    return hashlib.sha256(abs_recipe_root_path.encode("utf-8")).hexdigest()
 
 
 def _get_step_output_directory_path(execution_directory_path: str, step_name: str) -> str:
@@ -289,13 +349,22 @@ def _get_step_output_directory_path(execution_directory_path: str, step_name: st
 
 
 class _ExecutionPlan:
-    _MSG_REGEX = r'^echo "Run MLflow Recipe step: (\w+)"\n$'
+    _MSG_REGEX = re.compile(r'^echo "Run MLflow Recipe step: (\w+)"\n$')
     _FORMAT_STEPS_CACHED = "%s: No changes. Skipping."
 
     def __init__(self, rule_name, output_lines_of_make: List[str], recipe_step_names: List[str]):
+        self._rule_name = rule_name
         steps_to_run = self._parse_output_lines(output_lines_of_make)
         self.steps_cached = self._infer_cached_steps(rule_name, steps_to_run, recipe_step_names)
 
+    @property
+    def is_up_to_date(self) -> bool:
+        """
+        Whether the target step and all of the steps that it depends on are cached, in which
+        case there is nothing for Make to run.
+        """
+        return self._rule_name in self.steps_cached
+
     @staticmethod
     def _parse_output_lines(output_lines_of_make: List[str]) -> List[str]:
         """
@@ -303,7 +372,7 @@ class _ExecutionPlan:
         """
 
         def get_step_to_run(output_line: str):
-            m = re.search(_ExecutionPlan._MSG_REGEX, output_line)
+            m = _ExecutionPlan._MSG_REGEX.search(output_line)
             return m.group(1) if m else None
 
         def steps_to_run():
@@ -382,7 +451,12 @@ def _run_make(
         # return code will be 0 in this case. As long as `make -n` has no error, cached
         # steps inference logic can work correctly even when shell runtime error occurs.
         recipe_step_names = [step.name for step in recipe_steps]
-        _ExecutionPlan(rule_name, output_lines, recipe_step_names).print()
+        execution_plan = _ExecutionPlan(rule_name, output_lines, recipe_step_names)
+        execution_plan.print()
+        if execution_plan.is_up_to_date:
+            # Skip the second Make invocation, which would only re-parse the Makefile and
+            # re-check the timestamps of all targets to conclude that there is nothing to run
+            return
 
     _exec_cmd(
         ["make", "-s", "-f", "Makefile", rule_name],
@@ -415,13 +489,7 @@ def _create_makefile(recipe_root_path, execution_directory_path, template) -> No
         steps_folder_path = os.path.join(recipe_root_path, "steps")
         if not os.path.exists(steps_folder_path):
             os.mkdir(steps_folder_path)
-        for required_file in [
-            "ingest.py",
-            "split.py",
-            "train.py",
-            "transform.py",
-            "custom_metrics.py",
-        ]:
+        for required_file in _REQUIRED_STEP_FILE_NAMES:
             required_file_path = os.path.join(steps_folder_path, required_file)
             if not os.path.exists(required_file_path):
                 try:
@@ -530,8 +598,21 @@ class _MakefilePathFormat:
 
 # Makefile contents for cache-aware recipe execution. These contents include variable placeholders
 # that need to be formatted (substituted) with the recipe root directory in order to produce a
-# valid Makefile
+# valid Makefile. Rules depend on the hashes of user-defined step files under
+# `step_file_hashes/`, which are only rewritten when step file contents change
 _MAKEFILE_FORMAT_STRING = r"""
+# Every recipe target is defined explicitly below, so clear the built-in suffix rules and cancel
+# the built-in match-anything version control rules. This spares Make from searching them for ways
+# to remake each target and prerequisite whenever it is invoked. The rules are cancelled in the
+# Makefile rather than via `MAKEFLAGS += --no-builtin-rules`, which would be exported to the
+# environment of every step's subprocess
+.SUFFIXES:
+%:: %,v
+%:: RCS/%,v
+%:: RCS/%
+%:: s.%
+%:: SCCS/s.%
+
 # Define `ingest` as a target with no dependencies to ensure that it runs whenever a user explicitly
 # invokes the MLflow Recipes ingest step, allowing them to reingest data on-demand
 ingest:
@@ -542,7 +623,7 @@ ingest:
 # target. Downstream steps depend on the ingested dataset target, rather than the `ingest` target,
 # ensuring that data is only ingested for downstream steps if it is not already present on the
 # local filesystem
-steps/ingest/outputs/dataset.parquet: steps/ingest/conf.yaml {path:prp/steps/ingest.py}
+steps/ingest/outputs/dataset.parquet: steps/ingest/conf.yaml step_file_hashes/ingest.py.sha256
 	echo "Run MLflow Recipe step: ingest"
 	$(MAKE) ingest
 
@@ -550,7 +631,7 @@ split_objects = steps/split/outputs/train.parquet steps/split/outputs/validation
 
 split: $(split_objects)
 
-steps/%/outputs/train.parquet steps/%/outputs/validation.parquet steps/%/outputs/test.parquet: {path:prp/steps/split.py} steps/ingest/outputs/dataset.parquet steps/split/conf.yaml
+steps/%/outputs/train.parquet steps/%/outputs/validation.parquet steps/%/outputs/test.parquet: step_file_hashes/split.py.sha256 steps/ingest/outputs/dataset.parquet steps/split/conf.yaml
 	echo "Run MLflow Recipe step: split"
 	cd {path:prp/} && \
         python -c "from mlflow.recipes.steps.split import SplitStep; SplitStep.from_step_config_path(step_config_path='{path:exe/steps/split/conf.yaml}', recipe_root='{path:prp/}').run(output_directory='{path:exe/steps/split/outputs}')"
@@ -559,7 +640,7 @@ transform_objects = steps/transform/outputs/transformer.pkl steps/transform/outp
 
 transform: $(transform_objects)
 
-steps/%/outputs/transformer.pkl steps/%/outputs/transformed_training_data.parquet steps/%/outputs/transformed_validation_data.parquet: {path:prp/steps/transform.py} steps/split/outputs/train.parquet steps/split/outputs/validation.parquet steps/transform/conf.yaml
+steps/%/outputs/transformer.pkl steps/%/outputs/transformed_training_data.parquet steps/%/outputs/transformed_validation_data.parquet: step_file_hashes/transform.py.sha256 steps/split/outputs/train.parquet steps/split/outputs/validation.parquet steps/transform/conf.yaml
 	echo "Run MLflow Recipe step: transform"
 	cd {path:prp/} && \
         python -c "from mlflow.recipes.steps.transform import TransformStep; TransformStep.from_step_config_path(step_config_path='{path:exe/steps/transform/conf.yaml}', recipe_root='{path:prp/}').run(output_directory='{path:exe/steps/transform/outputs}')"
@@ -568,7 +649,7 @@ train_objects = steps/train/outputs/model steps/train/outputs/run_id
 
 train: $(train_objects)
 
-steps/%/outputs/model steps/%/outputs/run_id: {path:prp/steps/train.py} {path:prp/steps/custom_metrics.py} steps/transform/outputs/transformed_training_data.parquet steps/transform/outputs/transformed_validation_data.parquet steps/split/outputs/train.parquet steps/split/outputs/validation.parquet steps/transform/outputs/transformer.pkl steps/train/conf.yaml
+steps/%/outputs/model steps/%/outputs/run_id: step_file_hashes/train.py.sha256 step_file_hashes/custom_metrics.py.sha256 steps/transform/outputs/transformed_training_data.parquet steps/transform/outputs/transformed_validation_data.parquet steps/split/outputs/train.parquet steps/split/outputs/validation.parquet steps/transform/outputs/transformer.pkl steps/train/conf.yaml
 	echo "Run MLflow Recipe step: train"
 	cd {path:prp/} && \
         python -c "from mlflow.recipes.steps.train import TrainStep; TrainStep.from_step_config_path(step_config_path='{path:exe/steps/train/conf.yaml}', recipe_root='{path:prp/}').run(output_directory='{path:exe/steps/train/outputs}')"
@@ -577,7 +658,7 @@ evaluate_objects = steps/evaluate/outputs/model_validation_status
 
 evaluate: $(evaluate_objects)
 
-steps/%/outputs/model_validation_status: {path:prp/steps/custom_metrics.py} steps/train/outputs/model steps/split/outputs/validation.parquet steps/split/outputs/test.parquet steps/train/outputs/run_id steps/evaluate/conf.yaml
+steps/%/outputs/model_validation_status: step_file_hashes/custom_metrics.py.sha256 steps/train/outputs/model steps/split/outputs/validation.parquet steps/split/outputs/test.parquet steps/train/outputs/run_id steps/evaluate/conf.yaml
 	echo "Run MLflow Recipe step: evaluate"
 	cd {path:prp/} && \
         python -c "from mlflow.recipes.steps.evaluate import EvaluateStep; EvaluateStep.from_step_config_path(step_config_path='{path:exe/steps/evaluate/conf.yaml}', recipe_root='{path:prp/}').run(output_directory='{path:exe/steps/evaluate/outputs}')"
@@ -601,7 +682,7 @@ ingest_scoring:
 # `ingest_scoring` target. Downstream steps depend on the ingested dataset target, rather than the
 # `ingest_scoring` target, ensuring that data is only ingested for downstream steps if it is not
 # already present on the local filesystem
-steps/ingest_scoring/outputs/scoring-dataset.parquet: steps/ingest_scoring/conf.yaml {path:prp/steps/ingest.py}
+steps/ingest_scoring/outputs/scoring-dataset.parquet: steps/ingest_scoring/conf.yaml step_file_hashes/ingest.py.sha256
 	echo "Run MLflow Recipe step: ingest_scoring"
 	$(MAKE) ingest_scoring
 
@@ -4,6 +4,7 @@ import pathlib
 import shutil
 import tempfile
 import uuid
+from contextlib import contextmanager
 from typing import Any, Dict, Optional
 
 import mlflow
@@ -29,6 +30,10 @@ from mlflow.utils.mlflow_tags import (
 
 _logger = logging.getLogger(__name__)
 
+# Run tags environment variables keyed by recipe root path. Only populated within a
+# `cache_run_tags_env_vars()` context
+_run_tags_env_vars_cache: Optional[Dict[str, Dict[str, str]]] = None
+
 
 def _get_run_name(run_name_prefix):
     if run_name_prefix is None:
@@ -239,6 +244,22 @@ def apply_recipe_tracking_config(tracking_config: TrackingConfig):
     )
 
 
+@contextmanager
+def cache_run_tags_env_vars():
+    """
+    Within this context, ``get_run_tags_env_vars`` resolves run tags, which requires inspecting
+    the git repository of the recipe, once per recipe root path and reuses them for subsequent
+    calls. The cached values are discarded when the context exits.
+    """
+    global _run_tags_env_vars_cache
+
+    _run_tags_env_vars_cache = {}
+    try:
+        yield
+    finally:
+        _run_tags_env_vars_cache = None
+
+
 def get_run_tags_env_vars(recipe_root_path: str) -> Dict[str, str]:
     """
     Returns environment variables that should be set during step execution to ensure that MLflow
@@ -252,6 +273,15 @@ def get_run_tags_env_vars(recipe_root_path: str) -> Dict[str, str]:
     Returns:
         A dictionary of environment variable names and values.
     """
+    if _run_tags_env_vars_cache is None:
+        return _resolve_run_tags_env_vars(recipe_root_path)
+
+    if recipe_root_path not in _run_tags_env_vars_cache:
+        _run_tags_env_vars_cache[recipe_root_path] = _resolve_run_tags_env_vars(recipe_root_path)
+    return dict(_run_tags_env_vars_cache[recipe_root_path])
+
+
+def _resolve_run_tags_env_vars(recipe_root_path: str) -> Dict[str, str]:
     run_context_tags = resolve_tags()
 
     git_tags = {}
@@ -259,8 +259,8 @@ def write_yaml(root, file_name, data, overwrite=False, sort_keys=True, ensure_ya
 
 def overwrite_yaml(root, file_name, data, ensure_yaml_extension=True):
     """Safely overwrites a preexisting yaml file, ensuring that file contents are not deleted or
-    corrupted if the write fails. This is achieved by writing contents to a temporary file
-    and moving the temporary file to replace the preexisting file, rather than opening the
+    corrupted if the write fails. This is achieved by writing contents to a temporary file in the
+    same directory and atomically replacing the preexisting file with it, rather than opening the
     preexisting file for a direct write.
 
     Args:
@@ -270,25 +270,28 @@ def overwrite_yaml(root, file_name, data, ensure_yaml_extension=True):
         ensure_yaml_extension: If True, Will automatically add .yaml extension if not given.
 
     """
-    tmp_file_path = None
     original_file_path = os.path.join(root, file_name)
     original_file_mode = os.stat(original_file_path).st_mode
+    # Serialize the data up front so that the temporary file is populated with a single write
+    yaml_contents = yaml.dump(
+        data,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=True,
+        Dumper=YamlSafeDumper,
+    )
+    tmp_file_fd, tmp_file_path = tempfile.mkstemp(
+        dir=root, suffix=".yaml" if ensure_yaml_extension else None
+    )
     try:
-        tmp_file_fd, tmp_file_path = tempfile.mkstemp(suffix="file.yaml")
-        os.close(tmp_file_fd)
-        write_yaml(
-            root=get_parent_dir(tmp_file_path),
-            file_name=os.path.basename(tmp_file_path),
-            data=data,
-            overwrite=True,
-            sort_keys=True,
-            ensure_yaml_extension=ensure_yaml_extension,
-        )
-        shutil.move(tmp_file_path, original_file_path)
+        # Write in binary mode, like `write_yaml`, so that line endings are not translated
+        with os.fdopen(tmp_file_fd, mode="wb") as tmp_file:
+            tmp_file.write(yaml_contents.encode(ENCODING))
         # restores original file permissions, see https://docs.python.org/3/library/tempfile.html#tempfile.mkstemp
-        os.chmod(original_file_path, original_file_mode)
+        os.chmod(tmp_file_path, original_file_mode)
+        os.replace(tmp_file_path, original_file_path)
     finally:
-        if tmp_file_path is not None and os.path.exists(tmp_file_path):
+        if os.path.exists(tmp_file_path):
             os.remove(tmp_file_path)
 
 
@@ -5,10 +5,17 @@ import sys
 from pathlib import Path
 
 import pytest
+import yaml
 
 import mlflow
 from mlflow.environment_variables import MLFLOW_RECIPES_EXECUTION_DIRECTORY
-from mlflow.utils.file_utils import TempDir
+from mlflow.recipes import Recipe
+from mlflow.utils.file_utils import (
+    TempDir,
+    YamlSafeLoader,
+    overwrite_yaml,
+    path_to_local_file_uri,
+)
 
 from tests.recipes.helper_functions import (
     RECIPE_EXAMPLE_PATH_ENV_VAR_FOR_TESTS,
@@ -17,12 +24,17 @@ from tests.recipes.helper_functions import (
 )
 
 
-@pytest.fixture
-def enter_recipe_example_directory():
+def _get_recipe_example_path():
     recipe_example_path = os.environ.get(RECIPE_EXAMPLE_PATH_ENV_VAR_FOR_TESTS)
     if recipe_example_path is None:
         mlflow_repo_root_directory = pathlib.Path(mlflow.__file__).parent.parent
         recipe_example_path = mlflow_repo_root_directory / RECIPE_EXAMPLE_PATH_FROM_MLFLOW_ROOT
+    return recipe_example_path
+
+
+@pytest.fixture
+def enter_recipe_example_directory():
+    recipe_example_path = _get_recipe_example_path()
 
     with chdir(recipe_example_path):
         yield recipe_example_path
@@ -39,6 +51,50 @@ def enter_test_recipe_directory(enter_recipe_example_directory):
         yield os.getcwd()
 
 
+@pytest.fixture(scope="session")
+def completed_recipe(tmp_path_factory):
+    """
+    Runs the full example recipe once per test session in an isolated copy of the recipe
+    directory and returns the paths of the copied recipe root and its execution directory.
+    Tests must not modify these directories; use `enter_completed_recipe_directory` instead.
+    """
+    recipe_root_path = tmp_path_factory.mktemp("completed_recipe") / "recipe"
+    shutil.copytree(_get_recipe_example_path(), recipe_root_path)
+    # Use absolute tracking locations so that the copied recipe does not share a (relative)
+    # tracking URI, and therefore a cached tracking store, with the original example recipe
+    profile_path = recipe_root_path / "profiles" / "local.yaml"
+    profile_contents = yaml.load(profile_path.read_text(), Loader=YamlSafeLoader)
+    profile_contents["experiment"]["tracking_uri"] = "sqlite:///" + str(
+        recipe_root_path / "tracking.db"
+    )
+    profile_contents["experiment"]["artifact_location"] = path_to_local_file_uri(
+        str(recipe_root_path / "mlartifacts")
+    )
+    overwrite_yaml(profile_path.parent, profile_path.name, profile_contents)
+
+    execution_dir_path = tmp_path_factory.mktemp("completed_recipe_execution")
+    with pytest.MonkeyPatch.context() as mp, chdir(recipe_root_path):
+        mp.setenv(MLFLOW_RECIPES_EXECUTION_DIRECTORY.name, str(execution_dir_path))
+        Recipe(profile="local").run()
+    return recipe_root_path, execution_dir_path
+
+
+@pytest.fixture
+def enter_completed_recipe_directory(completed_recipe, monkeypatch, tmp_path):
+    """
+    Enters the root directory of the recipe run by `completed_recipe`, pointing the recipe at a
+    private copy of its execution directory so that tests can clean or rerun steps without
+    affecting other tests.
+    """
+    recipe_root_path, execution_dir_path = completed_recipe
+    execution_dir_copy_path = tmp_path / "recipe_execution"
+    shutil.copytree(execution_dir_path, execution_dir_copy_path)
+    monkeypatch.setenv(MLFLOW_RECIPES_EXECUTION_DIRECTORY.name, str(execution_dir_copy_path))
+
+    with chdir(recipe_root_path):
+        yield recipe_root_path
+
+
 @pytest.fixture
 def tmp_recipe_exec_path(monkeypatch, tmp_path) -> Path:
     path = tmp_path.joinpath("recipe_execution")
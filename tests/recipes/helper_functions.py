@@ -2,6 +2,7 @@ import os
 import random
 import shutil
 import string
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, Optional
@@ -89,6 +90,22 @@ def chdir(directory_path):
         os.chdir(og_dir)
 
 
+def hardlink_tree(src, dst):
+    """
+    Mirrors the directory tree at `src` into `dst` using hard links instead of copying file
+    contents, falling back to copying files that cannot be linked (e.g. across filesystems).
+    Only use this for trees that are not modified afterwards.
+    """
+
+    def link_or_copy(src_file, dst_file):
+        try:
+            os.link(src_file, dst_file)
+        except OSError:
+            shutil.copy2(src_file, dst_file)
+
+    shutil.copytree(src, dst, copy_function=link_or_copy, dirs_exist_ok=True)
+
+
 class BaseStepImplemented(BaseStep):
     def _run(self, output_directory):
         pass
@@ -117,9 +134,16 @@ class BaseStepImplemented(BaseStep):
 def list_all_artifacts(
     tracking_uri: str, run_id: str, path: Optional[str] = None
 ) -> Generator[str, None, None]:
-    artifacts = mlflow.tracking.MlflowClient(tracking_uri).list_artifacts(run_id, path)
-    for artifact in artifacts:
-        if artifact.is_dir:
-            yield from list_all_artifacts(tracking_uri, run_id, artifact.path)
-        else:
-            yield artifact.path
+    client = mlflow.tracking.MlflowClient(tracking_uri)
+    # Walk the artifact tree level by level, listing the directories of each level concurrently
+    dir_paths = [path]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        while dir_paths:
+            listings = executor.map(lambda p: client.list_artifacts(run_id, p), dir_paths)
+            dir_paths = []
+            for artifacts in listings:
+                for artifact in artifacts:
+                    if artifact.is_dir:
+                        dir_paths.append(artifact.path)
+                    else:
+                        yield artifact.path
@@ -50,6 +50,24 @@ def test_recipe_run_and_clean_individual_step_works(step, create_recipe):
     r.clean(step)
 
 
+def test_recipe_clean_individual_step_only_cleans_that_step_by_default(create_recipe):
+    r = create_recipe
+    r.run("train")
+    r.clean("transform")
+    assert r.get_artifact("training_data") is not None
+    assert r.get_artifact("transformed_training_data") is None
+    assert r.get_artifact("model") is not None
+
+
+def test_recipe_clean_individual_step_with_include_downstream(create_recipe):
+    r = create_recipe
+    r.run("train")
+    r.clean("transform", include_downstream=True)
+    assert r.get_artifact("training_data") is not None
+    assert r.get_artifact("transformed_training_data") is None
+    assert r.get_artifact("model") is None
+
+
 def test_get_subgraph_for_target_step(create_recipe):
     r = create_recipe
     train_subgraph = r._get_subgraph_for_target_step(r._get_step("ingest"))
@@ -1,3 +1,4 @@
+import json
 import os
 import pathlib
 import shutil
@@ -7,7 +8,10 @@ from unittest import mock
 import pandas as pd
 import pytest
 
-from mlflow.environment_variables import MLFLOW_RECIPES_EXECUTION_TARGET_STEP_NAME
+from mlflow.environment_variables import (
+    MLFLOW_RECIPES_EXECUTION_TARGET_STEP_NAME,
+    MLFLOW_RUN_CONTEXT,
+)
 from mlflow.recipes import Recipe
 from mlflow.recipes.step import StepStatus
 from mlflow.recipes.steps.ingest import IngestStep
@@ -15,10 +19,13 @@ from mlflow.recipes.steps.split import SplitStep
 from mlflow.recipes.steps.transform import TransformStep
 from mlflow.recipes.utils.execution import (
     _ExecutionPlan,
+    _get_execution_directory_basename,
     _get_or_create_execution_directory,
     get_step_output_path,
     run_recipe_step,
 )
+from mlflow.recipes.utils.tracking import get_run_tags_env_vars
+from mlflow.utils.process import _exec_cmd
 
 from tests.recipes.helper_functions import BaseStepImplemented
 
@@ -133,6 +140,20 @@ def test_create_required_step_files(tmp_path):
     check_required_files(True)
 
 
+def test_get_execution_directory_basename_resolves_relative_paths(tmp_path, monkeypatch):
+    (tmp_path / "a" / "recipe").mkdir(parents=True)
+    (tmp_path / "b" / "recipe").mkdir(parents=True)
+
+    monkeypatch.chdir(tmp_path / "a")
+    basename_a = _get_execution_directory_basename("recipe")
+    assert basename_a == _get_execution_directory_basename(str(tmp_path / "a" / "recipe"))
+
+    monkeypatch.chdir(tmp_path / "b")
+    basename_b = _get_execution_directory_basename("recipe")
+    assert basename_b == _get_execution_directory_basename(str(tmp_path / "b" / "recipe"))
+    assert basename_a != basename_b
+
+
 def test_get_or_create_execution_directory_is_idempotent(tmp_path):
     class TestStep(BaseStepImplemented):
         def __init__(self):
@@ -262,6 +283,45 @@ def test_run_recipe_step_sets_environment_as_expected(tmp_path):
     assert mock_run_in_subprocess.call_count == 2
 
 
+def test_run_recipe_step_resolves_run_tags_once_per_execution(tmp_path):
+    class TestStep(BaseStepImplemented):
+        def __init__(self, name):
+            self.step_config = {}
+            self._name = name
+
+        @property
+        def name(self):
+            return self._name
+
+        @property
+        def environment(self):
+            return get_run_tags_env_vars(recipe_root_path=str(tmp_path))
+
+    with mock.patch(
+        "mlflow.recipes.utils.execution._exec_cmd"
+    ) as mock_run_in_subprocess, mock.patch(
+        "mlflow.recipes.utils.execution._ExecutionPlan"
+    ), mock.patch(
+        "mlflow.recipes.utils.tracking.resolve_tags", return_value={"a": "b"}
+    ) as mock_resolve_tags:
+        process = mock.Mock()
+        process.stdout.readline = mock.Mock(side_effect="")
+        mock_run_in_subprocess.return_value = process
+
+        recipe_steps = [TestStep("test_step_1"), TestStep("test_step_2")]
+        for _ in range(2):
+            run_recipe_step(
+                recipe_root_path=tmp_path,
+                recipe_steps=recipe_steps,
+                target_step=recipe_steps[1],
+                template="regression/v1",
+            )
+
+    assert mock_resolve_tags.call_count == 2
+    _, subprocess_call_kwargs = mock_run_in_subprocess.call_args
+    assert json.loads(subprocess_call_kwargs["extra_env"][MLFLOW_RUN_CONTEXT.name]) == {"a": "b"}
+
+
 def test_run_recipe_step_calls_execution_plan(tmp_path):
     class TestStep(BaseStepImplemented):
         def __init__(self):
@@ -441,6 +501,48 @@ def test_run_recipe_step_caches(test_recipe, target_step):
     assert step_outputs_with_timestamps_2 == step_outputs_with_timestamps_1
 
 
+def test_run_recipe_step_skips_make_when_all_steps_are_cached(test_recipe):
+    _, _, transform_step = test_recipe
+    run_test_recipe_step(test_recipe, transform_step)
+
+    with mock.patch("mlflow.recipes.utils.execution._exec_cmd", wraps=_exec_cmd) as mock_exec_cmd:
+        run_test_recipe_step(test_recipe, transform_step)
+
+    # Only the dry run is executed
+    mock_exec_cmd.assert_called_once()
+    assert mock_exec_cmd.call_args.args[0] == ["make", "-n", "-f", "Makefile", "transform"]
+
+
+def test_run_recipe_step_reruns_only_when_step_file_content_changes(test_recipe):
+    _, _, transform_step = test_recipe
+    transform_file_path = pathlib.Path.cwd() / "steps" / "transform.py"
+
+    run_test_recipe_step(test_recipe, transform_step)
+    step_execution_state_1 = get_test_recipe_step_execution_state(transform_step)
+    assert step_execution_state_1.status == StepStatus.SUCCEEDED
+
+    # Updating the modification time of the step file without changing its content should not
+    # invalidate the cached step outputs
+    future_time = time.time() + 60
+    os.utime(transform_file_path, (future_time, future_time))
+    run_test_recipe_step(test_recipe, transform_step)
+    step_execution_state_2 = get_test_recipe_step_execution_state(transform_step)
+    assert (
+        step_execution_state_2.last_updated_timestamp
+        == step_execution_state_1.last_updated_timestamp
+    )
+
+    with open(transform_file_path, "a") as f:
+        f.write("\n# updated\n")
+    run_test_recipe_step(test_recipe, transform_step)
+    step_execution_state_3 = get_test_recipe_step_execution_state(transform_step)
+    assert step_execution_state_3.status == StepStatus.SUCCEEDED
+    assert (
+        step_execution_state_3.last_updated_timestamp
+        > step_execution_state_1.last_updated_timestamp
+    )
+
+
 def test_run_recipe_with_ingest_step_as_target_clears_downstream_step_state(test_recipe):
     ingest_step, split_step, transform_step = test_recipe
 
@@ -555,6 +657,7 @@ def test_execution_plan():
     # all steps are cached
     plan = _ExecutionPlan("register", ["make: `register' is up to date."], train_subgraph)
     assert plan.steps_cached == train_subgraph
+    assert plan.is_up_to_date
 
     # all steps will be executed
     plan = _ExecutionPlan(
@@ -567,6 +670,7 @@ def test_execution_plan():
         train_subgraph,
     )
     assert plan.steps_cached == []
+    assert not plan.is_up_to_date
 
     plan = _ExecutionPlan(
         "transform", ['echo "Run MLflow Recipe step: transform"\n'], train_subgraph
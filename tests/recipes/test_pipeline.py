@@ -1,7 +1,6 @@
 import os
 import pathlib
 import re
-import shutil
 from unittest import mock
 
 import pandas as pd
@@ -12,6 +11,7 @@ import mlflow
 from mlflow.entities import Run, SourceType
 from mlflow.entities.model_registry import ModelVersion
 from mlflow.exceptions import MlflowException
+from mlflow.recipes.cards import CARD_HTML_NAME, CARD_PICKLE_NAME
 from mlflow.recipes.recipe import Recipe
 from mlflow.recipes.step import BaseStep
 from mlflow.recipes.utils.execution import (
@@ -21,7 +21,7 @@ from mlflow.recipes.utils.execution import (
 )
 from mlflow.tracking.client import MlflowClient
 from mlflow.tracking.context.registry import resolve_tags
-from mlflow.utils.file_utils import path_to_local_file_uri
+from mlflow.utils.file_utils import YamlSafeLoader, overwrite_yaml, path_to_local_file_uri
 from mlflow.utils.mlflow_tags import (
     LEGACY_MLFLOW_GIT_REPO_URL,
     MLFLOW_GIT_COMMIT,
@@ -30,11 +30,28 @@ from mlflow.utils.mlflow_tags import (
     MLFLOW_SOURCE_TYPE,
 )
 
-from tests.recipes.helper_functions import chdir, list_all_artifacts
+from tests.recipes.helper_functions import (
+    BaseStepImplemented,
+    chdir,
+    hardlink_tree,
+    list_all_artifacts,
+)
 
 # _STEP_NAMES must contain all step names that are expected to be executed when
 # `recipe.run(step=None)` is called
 _STEP_NAMES = ["ingest", "split", "transform", "train", "evaluate", "register"]
+_RUN_STEP_RE = re.compile(r"Running step (\w+)\.\.\.")
+_CACHED_STEPS_RE = re.compile(r"((?:\w+, )*\w+): No changes\. Skipping\.")
+_MAKE_ERROR_RE = re.compile(r"\*\*\*.+Error")
+_MAKE_MISSING_SEPARATOR_RE = re.compile(r"\*\*\* missing separator\.  Stop\.")
+
+
+def _get_run_steps(output):
+    return _RUN_STEP_RE.findall(output)
+
+
+def _get_cached_steps(output):
+    return [step for steps in _CACHED_STEPS_RE.findall(output) for step in steps.split(", ")]
 
 
 @pytest.mark.usefixtures("enter_recipe_example_directory")
@@ -63,9 +80,8 @@ def test_create_recipe_fails_with_empty_profile_name(empty_profile):
 def test_create_recipe_fails_with_path_containing_space(tmp_path):
     space_parent = tmp_path / "space parent"
     space_path = space_parent / "child"
-    os.makedirs(space_parent, exist_ok=True)
-    os.makedirs(space_path, exist_ok=True)
-    shutil.copytree(src=os.getcwd(), dst=str(space_path), dirs_exist_ok=True)
+    space_path.mkdir(parents=True, exist_ok=True)
+    hardlink_tree(os.getcwd(), str(space_path))
 
     with chdir(space_path), pytest.raises(
         MlflowException, match="Recipe directory path cannot contain spaces"
@@ -112,24 +128,21 @@ def test_recipes_execution_directory_is_managed_as_expected(
         assert not list(step_outputs_path.iterdir())
 
 
-@pytest.mark.usefixtures("enter_test_recipe_directory")
 def test_recipes_log_to_expected_mlflow_backend_with_expected_run_tags_once_on_reruns(
-    tmp_path,
+    enter_test_recipe_directory, tmp_path
 ):
     experiment_name = "my_test_exp"
     tracking_uri = "sqlite:///" + str((tmp_path / "tracking_dst.db").resolve())
     artifact_location = str((tmp_path / "mlartifacts").resolve())
 
-    profile_path = pathlib.Path.cwd() / "profiles" / "local.yaml"
-    with open(profile_path) as f:
-        profile_contents = yaml.safe_load(f)
+    profile_path = pathlib.Path(enter_test_recipe_directory) / "profiles" / "local.yaml"
+    profile_contents = yaml.load(profile_path.read_text(), Loader=YamlSafeLoader)
 
     profile_contents["experiment"]["name"] = experiment_name
     profile_contents["experiment"]["tracking_uri"] = tracking_uri
     profile_contents["experiment"]["artifact_location"] = path_to_local_file_uri(artifact_location)
 
-    with open(profile_path, "w") as f:
-        yaml.safe_dump(profile_contents, f)
+    overwrite_yaml(profile_path.parent, profile_path.name, profile_contents)
 
     mlflow.set_tracking_uri(tracking_uri)
     recipe = Recipe(profile="local")
@@ -143,16 +156,15 @@ def test_recipes_log_to_expected_mlflow_backend_with_expected_run_tags_once_on_r
         str((pathlib.Path(artifact_location) / logged_run.info.run_id / "artifacts").resolve())
     )
     assert "test_r2_score" in logged_run.data.metrics
-    artifacts = MlflowClient(tracking_uri).list_artifacts(
-        run_id=logged_run.info.run_id, path="train"
-    )
+    client = MlflowClient(tracking_uri)
+    artifacts = client.list_artifacts(run_id=logged_run.info.run_id, path="train")
     assert {artifact.path for artifact in artifacts} == {
         "train/best_parameters.yaml",
         "train/card.html",
         "train/estimator",
         "train/model",
     }
-    run_tags = MlflowClient(tracking_uri).get_run(run_id=logged_run.info.run_id).data.tags
+    run_tags = client.get_run(run_id=logged_run.info.run_id).data.tags
     recipe_source_tag = {MLFLOW_SOURCE_TYPE: SourceType.to_string(SourceType.RECIPE)}
     assert resolve_tags(recipe_source_tag).items() <= run_tags.items()
 
@@ -161,15 +173,13 @@ def test_recipes_log_to_expected_mlflow_backend_with_expected_run_tags_once_on_r
     assert len(logged_runs) == 1
 
 
-@pytest.mark.usefixtures("enter_recipe_example_directory")
-def test_recipes_run_sets_mlflow_git_tags():
+def test_recipes_run_sets_mlflow_git_tags(enter_recipe_example_directory):
     recipe = Recipe(profile="local")
     recipe.clean()
     recipe.run(step="train")
 
-    profile_path = pathlib.Path.cwd() / "profiles" / "local.yaml"
-    with open(profile_path) as f:
-        profile_contents = yaml.safe_load(f)
+    profile_path = pathlib.Path(enter_recipe_example_directory) / "profiles" / "local.yaml"
+    profile_contents = yaml.load(profile_path.read_text(), Loader=YamlSafeLoader)
 
     tracking_uri = profile_contents["experiment"]["tracking_uri"]
     experiment_name = profile_contents["experiment"]["name"]
@@ -192,16 +202,15 @@ def test_recipes_run_sets_mlflow_git_tags():
     assert run_tags[MLFLOW_SOURCE_NAME] == run_tags[MLFLOW_GIT_REPO_URL]
 
 
-@pytest.mark.usefixtures("enter_test_recipe_directory")
-def test_recipes_run_throws_exception_and_produces_failure_card_when_step_fails():
-    profile_path = pathlib.Path.cwd() / "profiles" / "local.yaml"
-    with open(profile_path) as f:
-        profile_contents = yaml.safe_load(f)
+def test_recipes_run_throws_exception_and_produces_failure_card_when_step_fails(
+    enter_test_recipe_directory,
+):
+    profile_path = pathlib.Path(enter_test_recipe_directory) / "profiles" / "local.yaml"
+    profile_contents = yaml.load(profile_path.read_text(), Loader=YamlSafeLoader)
 
     profile_contents["INGEST_CONFIG"] = {"using": "parquet", "location": "a bad location"}
 
-    with open(profile_path, "w") as f:
-        yaml.safe_dump(profile_contents, f)
+    overwrite_yaml(profile_path.parent, profile_path.name, profile_contents)
 
     recipe = Recipe(profile="local")
     recipe.clean()
@@ -217,19 +226,16 @@ def test_recipes_run_throws_exception_and_produces_failure_card_when_step_fails(
         step_name="ingest",
         relative_path="card.html",
     )
-    with open(step_card_path) as f:
-        card_content = f.read()
+    card_content = pathlib.Path(step_card_path).read_text()
 
     assert "Ingest" in card_content
     assert "Failed" in card_content
     assert "Stacktrace" in card_content
 
 
-@pytest.mark.usefixtures("enter_recipe_example_directory")
+@pytest.mark.usefixtures("enter_completed_recipe_directory")
 def test_test_step_logs_step_cards_as_artifacts():
     recipe = Recipe(profile="local")
-    recipe.clean()
-    recipe.run()
 
     tracking_uri = recipe._get_step("train").tracking_config.tracking_uri
     local_run_id_path = get_step_output_path(
@@ -251,16 +257,9 @@ def test_test_step_logs_step_cards_as_artifacts():
     )
 
 
-@pytest.mark.usefixtures("enter_recipe_example_directory")
+@pytest.mark.usefixtures("enter_completed_recipe_directory")
 def test_recipe_get_artifacts():
     recipe = Recipe(profile="local")
-    recipe.clean()
-
-    recipe.run("ingest")
-    recipe.run("split")
-    recipe.run("transform")
-    recipe.run("train")
-    recipe.run("register")
 
     assert isinstance(recipe.get_artifact("ingested_data"), pd.DataFrame)
     assert isinstance(recipe.get_artifact("training_data"), pd.DataFrame)
@@ -311,6 +310,31 @@ def test_generate_worst_examples_dataframe():
     assert_result_correct(result_df2)
 
 
+@pytest.mark.parametrize("in_ipython", [True, False])
+def test_step_inspect_only_renders_card_in_ipython(in_ipython, tmp_path):
+    class TestStep(BaseStepImplemented):
+        def __init__(self):
+            pass
+
+    (tmp_path / CARD_PICKLE_NAME).touch()
+    with mock.patch(
+        "mlflow.recipes.step.is_running_in_ipython_environment", return_value=in_ipython
+    ), mock.patch("mlflow.recipes.step.BaseCard.load") as mock_load_card, mock.patch(
+        "mlflow.recipes.step.display_html"
+    ) as mock_display_html:
+        TestStep().inspect(str(tmp_path))
+
+    card_html_path = str(tmp_path / CARD_HTML_NAME)
+    if in_ipython:
+        mock_display_html.assert_called_once_with(
+            html_data=mock_load_card.return_value.to_html.return_value,
+            html_file_path=card_html_path,
+        )
+    else:
+        mock_load_card.assert_not_called()
+        mock_display_html.assert_called_once_with(html_file_path=card_html_path)
+
+
 @pytest.mark.usefixtures("enter_recipe_example_directory")
 def test_print_cached_steps_and_running_steps(capsys):
     recipe = Recipe(profile="local")
@@ -318,18 +342,14 @@ def test_print_cached_steps_and_running_steps(capsys):
     recipe.run()
     captured = capsys.readouterr()
     output_info = captured.out
-    run_step_pattern = "Running step {step}..."
-    for step in _STEP_NAMES:
-        # Check for printed message when every step is actually executed
-        assert re.search(run_step_pattern.format(step=step), output_info) is not None
+    # Check for printed message when every step is actually executed
+    assert set(_get_run_steps(output_info)).issuperset(_STEP_NAMES)
 
     recipe.run()  # cached
     captured = capsys.readouterr()
     output_info = captured.err
-    cached_step_pattern = "{step}: No changes. Skipping."
-    cached_steps = ", ".join(_STEP_NAMES)
     # Check for printed message when steps are cached
-    assert re.search(cached_step_pattern.format(step=cached_steps), output_info) is not None
+    assert _get_cached_steps(output_info) == _STEP_NAMES
 
 
 @pytest.mark.usefixtures("enter_recipe_example_directory")
@@ -347,12 +367,10 @@ def test_make_dry_run_error_does_not_print_cached_steps_messages(capsys):
             pass
         captured = capsys.readouterr()
         output_info = captured.out
-        assert re.search(r"\*\*\* missing separator.  Stop.", output_info) is not None
+        assert _MAKE_MISSING_SEPARATOR_RE.search(output_info) is not None
 
         output_info = captured.err
-        cached_step_pattern = "{step}: No changes. Skipping."
-        for step in _STEP_NAMES:
-            assert re.search(cached_step_pattern.format(step=step), output_info) is None
+        assert _get_cached_steps(output_info) == []
 
 
 @pytest.mark.usefixtures("enter_recipe_example_directory")
@@ -376,11 +394,12 @@ def test_makefile_with_runtime_error_print_cached_steps_messages(capsys):
         captured = capsys.readouterr()
         output_info = captured.out
         # Runtime error occurs
-        assert re.search(r"\*\*\*.+Error", output_info) is not None
+        assert _MAKE_ERROR_RE.search(output_info) is not None
+        run_steps = _get_run_steps(output_info)
         # ingest step is executed
-        assert re.search("Running step ingest...", output_info) is not None
+        assert "ingest" in run_steps
         # split step is not executed
-        assert re.search("Running step split...", output_info) is None
+        assert "split" not in run_steps
 
         try:
             r.run(step="split")
@@ -389,9 +408,10 @@ def test_makefile_with_runtime_error_print_cached_steps_messages(capsys):
         captured = capsys.readouterr()
         output_info = captured.out
         # Runtime error occurs
-        assert re.search(r"\*\*\*.+Error", output_info) is not None
+        assert _MAKE_ERROR_RE.search(output_info) is not None
         output_info = captured.err
+        cached_steps = _get_cached_steps(output_info)
         # ingest step is cached
-        assert re.search("ingest: No changes. Skipping.", output_info) is not None
+        assert "ingest" in cached_steps
         # split step is not cached
-        assert re.search("split: No changes. Skipping.", output_info) is None
+        assert "split" not in cached_steps
@@ -7,7 +7,12 @@ import yaml
 
 import mlflow
 from mlflow.recipes.utils import get_recipe_config
-from mlflow.recipes.utils.tracking import get_recipe_tracking_config, log_code_snapshot
+from mlflow.recipes.utils.tracking import (
+    cache_run_tags_env_vars,
+    get_recipe_tracking_config,
+    get_run_tags_env_vars,
+    log_code_snapshot,
+)
 from mlflow.utils.file_utils import path_to_local_file_uri, path_to_local_sqlite_uri
 
 from tests.recipes.helper_functions import list_all_artifacts
@@ -170,3 +175,20 @@ def test_log_code_snapshot(tmp_path: pathlib.Path):
 
     artifacts = set(list_all_artifacts(tracking_uri, run.info.run_id))
     assert artifacts.issuperset(f"recipe_snapshot/{f}" for f in files)
+
+
+def test_get_run_tags_env_vars_is_only_cached_within_context(tmp_path: pathlib.Path):
+    with mock.patch(
+        "mlflow.recipes.utils.tracking.resolve_tags", return_value={"a": "b"}
+    ) as mock_resolve_tags:
+        get_run_tags_env_vars(recipe_root_path=str(tmp_path))
+        get_run_tags_env_vars(recipe_root_path=str(tmp_path))
+        assert mock_resolve_tags.call_count == 2
+
+        with cache_run_tags_env_vars():
+            get_run_tags_env_vars(recipe_root_path=str(tmp_path))
+            get_run_tags_env_vars(recipe_root_path=str(tmp_path))
+        assert mock_resolve_tags.call_count == 3
+
+        get_run_tags_env_vars(recipe_root_path=str(tmp_path))
+        assert mock_resolve_tags.call_count == 4
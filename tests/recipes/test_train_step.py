@@ -554,6 +554,28 @@ def test_train_step_with_tuning_child_runs_and_early_stop(
     assert ordered_metrics == sorted(ordered_metrics)
 
 
+def test_log_estimator_to_mlflow_logs_params_and_tags_in_single_batch(tmp_recipe_root_path: Path):
+    train_step = setup_train_step_with_tuning(tmp_recipe_root_path, use_tuning=False)
+    train_step.code_paths = None
+    X = pd.DataFrame({"a": [0.0, 1.0, 2.0, 3.0], "b": [1.0, 0.0, 1.0, 0.0]})
+    estimator = estimator_fn().fit(X, [0.0, 1.0, 2.0, 3.0])
+
+    with mlflow.start_run() as run, mock.patch(
+        "mlflow.recipes.steps.train.MlflowClient"
+    ) as mock_client, mock.patch("mlflow.sklearn.log_model"):
+        train_step._log_estimator_to_mlflow(estimator, X, on_worker=True)
+
+    mock_client.return_value.log_batch.assert_called_once()
+    _, log_batch_kwargs = mock_client.return_value.log_batch.call_args
+    assert log_batch_kwargs["run_id"] == run.info.run_id
+    assert log_batch_kwargs["metrics"] == []
+    assert {param.key for param in log_batch_kwargs["params"]} == set(estimator.get_params())
+    assert {tag.key: tag.value for tag in log_batch_kwargs["tags"]} == {
+        "estimator_name": "SGDRegressor",
+        "estimator_class": "sklearn.linear_model._stochastic_gradient.SGDRegressor",
+    }
+
+
 @pytest.mark.skipif("hyperopt" not in sys.modules, reason="requires hyperopt to be installed")
 def test_search_space(tmp_recipe_root_path):
     tuning_params_yaml = tmp_recipe_root_path.joinpath("tuning_params.yaml")
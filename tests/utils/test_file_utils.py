@@ -73,6 +73,21 @@ def test_yaml_read_and_write(tmp_path):
     assert "more_text" not in file_utils.read_yaml(temp_dir, yaml_file)
 
 
+def test_overwrite_yaml_replaces_file_and_preserves_permissions(tmp_path):
+    yaml_file = random_file("yaml")
+    file_utils.write_yaml(str(tmp_path), yaml_file, {"a": 1})
+    yaml_path = tmp_path / yaml_file
+    yaml_path.chmod(0o640)
+
+    file_utils.overwrite_yaml(str(tmp_path), yaml_file, {"a": 2, "text_value": "中文"})
+
+    assert file_utils.read_yaml(str(tmp_path), yaml_file) == {"a": 2, "text_value": "中文"}
+    assert yaml_path.read_bytes() == "a: 2\ntext_value: 中文\n".encode()
+    assert stat.S_IMODE(yaml_path.stat().st_mode) == 0o640
+    # The temporary file used for the write has been moved into place
+    assert os.listdir(tmp_path) == [yaml_file]
+
+
 def test_render_and_merge_yaml(tmp_path, monkeypatch):
     json_file = random_file("json")
     extra_config = {"key": 123}